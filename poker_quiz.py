@@ -7,21 +7,24 @@ A multiple choice quiz that tests knowledge of Texas Hold'em hand rankings.
 
 import argparse
 import random
-from dataclasses import dataclass
-from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from enum import IntEnum
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from math import prod
+from operator import attrgetter
+from typing import ClassVar, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
-class Suit(Enum):
-    """Card suits."""
+class Suit(IntEnum):
+    """Card suits (red suits first)."""
 
-    HEARTS = "♥"
-    DIAMONDS = "♦"
-    CLUBS = "♣"
-    SPADES = "♠"
+    HEARTS = 0
+    DIAMONDS = 1
+    CLUBS = 2
+    SPADES = 3
 
 
-class Rank(Enum):
+class Rank(IntEnum):
     """Card ranks."""
 
     TWO = 2
@@ -39,50 +42,112 @@ class Rank(Enum):
     ACE = 14
 
 
-@dataclass
+# Display symbols, indexed by suit and by rank value
+_SUIT_GLYPHS = ("♥", "♦", "♣", "♠")
+_RANK_SYMBOLS = ("", "") + tuple("23456789") + ("10", "J", "Q", "K", "A")
+
+# Cactus Kev card encoding: one prime per rank (deuce to ace) and one bit per
+# suit, indexed by suit (hearts, diamonds, clubs, spades)
+_RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_SUIT_BITS = (0x2, 0x4, 0x8, 0x1)
+
+
 class Card:
-    """Represents a playing card."""
+    """
+    Represents a playing card.
+
+    Besides its rank and suit, every card carries its Cactus Kev encoding in
+    ``bits`` (``xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp``): one bit per rank in the
+    high 13 bits, the suit bit, the rank index and the rank prime, and
+    ``_key`` counts the card once in a packed key of card counts. Cards are
+    immutable and interned: ``Card(rank, suit)`` always returns the same one of
+    52 instances, so equality and hashing are by identity and the encoding,
+    string form and color are computed once per card.
+    """
+
+    __slots__ = ("rank", "suit", "bits", "_key", "_str", "_red")
 
     rank: Rank
     suit: Suit
+    bits: int
+    _key: int
+    _str: str
+    _red: bool
+
+    # The interned cards, keyed by (rank, suit)
+    _POOL: ClassVar[Dict[Tuple[int, int], "Card"]] = {}
+
+    def __new__(cls, rank: int, suit: int) -> "Card":
+        """
+        Return the interned card of a rank and suit.
+
+        Args:
+            rank: Rank of the card, as a Rank or its integer value.
+            suit: Suit of the card, as a Suit or its integer value.
+
+        Raises:
+            ValueError: If rank or suit is not a valid Rank or Suit value.
+        """
+        card = cls._POOL.get((rank, suit))
+        if card is not None:
+            return card
+
+        rank, suit = Rank(rank), Suit(suit)
+        index = rank - 2
+        card = super().__new__(cls)
+        for name, value in (
+            ("rank", rank),
+            ("suit", suit),
+            (
+                "bits",
+                (1 << (16 + index))
+                | (_SUIT_BITS[suit] << 12)
+                | (index << 8)
+                | _RANK_PRIMES[index],
+            ),
+            # One in the card's 3-bit field, by deck position (suit-major)
+            ("_key", 1 << (3 * (13 * suit + index))),
+            ("_str", f"{_RANK_SYMBOLS[rank]}{_SUIT_GLYPHS[suit]}"),
+            ("_red", suit <= Suit.DIAMONDS),
+        ):
+            object.__setattr__(card, name, value)
+        cls._POOL[(rank, suit)] = card
+        return card
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Cards are immutable."""
+        raise AttributeError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        """Cards are immutable."""
+        raise AttributeError(f"cannot delete field '{name}'")
+
+    def __reduce__(self) -> Tuple[type, Tuple[Rank, Suit]]:
+        """Copy and unpickle to the interned card."""
+        return (Card, (self.rank, self.suit))
+
+    def __repr__(self) -> str:
+        """Debug representation of the card."""
+        return f"Card(rank={self.rank!r}, suit={self.suit!r})"
 
     def __str__(self) -> str:
         """String representation of the card."""
-        rank_str = {
-            Rank.TWO: "2",
-            Rank.THREE: "3",
-            Rank.FOUR: "4",
-            Rank.FIVE: "5",
-            Rank.SIX: "6",
-            Rank.SEVEN: "7",
-            Rank.EIGHT: "8",
-            Rank.NINE: "9",
-            Rank.TEN: "10",
-            Rank.JACK: "J",
-            Rank.QUEEN: "Q",
-            Rank.KING: "K",
-            Rank.ACE: "A",
-        }[self.rank]
-        return f"{rank_str}{self.suit.value}"
-
-    def __eq__(self, other: object) -> bool:
-        """Check if two cards are equal."""
-        if not isinstance(other, Card):
-            return False
-        return self.rank == other.rank and self.suit == other.suit
-
-    def __hash__(self) -> int:
-        """Make card hashable."""
-        return hash((self.rank, self.suit))
+        return self._str
 
     def is_red(self) -> bool:
         """Check if card is red (hearts or diamonds)."""
-        return self.suit in (Suit.HEARTS, Suit.DIAMONDS)
+        return self._red
+
+
+# Extracts ``Card._key`` in C when mapped over cards
+_card_key = attrgetter("_key")
 
 
 class Hand:
     """Represents a player's hand (2 cards)."""
 
+    __slots__ = ("cards",)
+
     def __init__(self, card1: Card, card2: Card):
         """
         Initialize a hand with two cards.
@@ -91,7 +156,7 @@ class Hand:
             card1: First card in the hand.
             card2: Second card in the hand.
         """
-        self.cards = [card1, card2]
+        self.cards: Tuple[Card, Card] = (card1, card2)
 
     def __str__(self) -> str:
         """String representation of the hand."""
@@ -107,92 +172,171 @@ class Hand:
         Returns:
             Tuple of (hand_rank, tiebreaker_values, hand_name).
             Lower hand_rank is better (0 = straight flush, 8 = high card).
+
+        Raises:
+            ValueError: If duplicate cards leave no valid hand.
         """
-        all_cards = self.cards + board.cards
-        return evaluate_best_hand(all_cards)
+        # Summing per-card counts gives the same key however the cards are ordered
+        cards_key = sum(map(_card_key, board.cards), sum(map(_card_key, self.cards)))
+        hand_rank, tiebreakers, name = _evaluate_cached(cards_key)
+        return (hand_rank, list(tiebreakers), name)
 
 
 class Board:
     """Represents the community board (5 cards)."""
 
-    def __init__(self, cards: List[Card]):
+    __slots__ = ("cards",)
+
+    def __init__(self, cards: Iterable[Card]):
         """
         Initialize board with 5 cards.
 
         Args:
-            cards: List of exactly 5 cards for the community board.
+            cards: Exactly 5 cards for the community board, stored as a tuple.
 
         Raises:
             ValueError: If the number of cards is not exactly 5.
         """
+        cards = tuple(cards)
         if len(cards) != 5:
             raise ValueError("Board must have exactly 5 cards")
-        self.cards = cards
+        self.cards: Tuple[Card, ...] = cards
 
     def __str__(self) -> str:
         """String representation of the board."""
-        return " ".join(str(card) for card in self.cards)
+        return " ".join(map(str, self.cards))
+
+
+# The 52 interned cards of a standard deck, shared by every quiz
+_DECK: Tuple[Card, ...] = tuple(Card(rank, suit) for suit in Suit for rank in Rank)
 
+# Cactus Kev encoding of each card, indexed by deck position
+_DECK_BITS: Tuple[int, ...] = tuple(card.bits for card in _DECK)
 
-def create_deck() -> List[Card]:
+
+def create_deck() -> Tuple[Card, ...]:
     """
-    Create a standard 52-card deck.
+    Get a standard 52-card deck.
+
+    The deck is deterministic, so the same immutable tuple of interned cards is
+    returned on every call; use ``list(create_deck())`` to get a deck that can
+    be shuffled.
 
     Returns:
-        List of 52 Card objects representing a standard deck.
+        Tuple of 52 Card objects representing a standard deck.
     """
-    deck = []
-    for suit in Suit:
-        for rank in Rank:
-            deck.append(Card(rank, suit))
-    return deck
+    return _DECK
 
 
-def evaluate_best_hand(cards: List[Card]) -> Tuple[int, List[int], str]:
+# Rank names, indexed by rank value
+_RANK_NAMES = ("", "") + (
+    "Two",
+    "Three",
+    "Four",
+    "Five",
+    "Six",
+    "Seven",
+    "Eight",
+    "Nine",
+    "Ten",
+    "Jack",
+    "Queen",
+    "King",
+    "Ace",
+)
+
+
+def get_rank_name(rank_value: int) -> str:
     """
-    Evaluate the best 5-card hand from 7 cards.
+    Get the name of a rank value.
 
     Args:
-        cards: List of 7 cards (2 hole cards + 5 board cards).
+        rank_value: Integer value of the rank (2-14).
 
     Returns:
-        Tuple of (hand_rank, tiebreaker_values, hand_name).
-        Lower hand_rank is better (0 = straight flush, 8 = high card).
+        String name of the rank (e.g., "Two", "Ace"). If rank_value is not
+        in the standard range, returns the string representation of the value.
+    """
+    if 2 <= rank_value <= 14:
+        return _RANK_NAMES[rank_value]
+    return str(rank_value)
 
-    Raises:
-        ValueError: If fewer than 5 cards are provided.
+
+# Hand name templates, indexed by hand rank; {0} and {1} are the names of the
+# first two tiebreaker ranks
+_HAND_NAME_FORMATS = (
+    "Straight Flush ({0} high)",
+    "Four of a Kind ({0}s)",
+    "Full House ({0}s over {1}s)",
+    "Flush ({0} high)",
+    "Straight ({0} high)",
+    "Three of a Kind ({0}s)",
+    "Two Pair ({0}s and {1}s)",
+    "Pair of {0}s",
+    "High Card ({0})",
+)
+
+
+def _hand_name(hand_rank: int, tiebreakers: List[int]) -> str:
     """
-    if len(cards) < 5:
-        raise ValueError("Need at least 5 cards to evaluate a hand")
+    Describe a hand from its rank and tiebreakers.
+
+    Args:
+        hand_rank: Hand category (0 = straight flush, 8 = high card).
+        tiebreakers: Tiebreaker values as returned by the evaluators.
+
+    Returns:
+        Human-readable hand name, e.g. "Full House (Aces over Kings)".
+    """
+    rank_names = [get_rank_name(value) for value in tiebreakers[:2]]
+    return _HAND_NAME_FORMATS[hand_rank].format(*rank_names)
+
+
+def _straight_high(rank_mask: int) -> int:
+    """
+    Find the highest straight in a rank bitmask.
 
-    # Generate all possible 5-card combinations
-    from itertools import combinations
+    Args:
+        rank_mask: 13-bit mask with bit ``r - 2`` set for every rank ``r`` present.
 
-    best_rank = 8
-    best_tiebreakers: List[int] = []
-    best_name = "High Card"
+    Returns:
+        High card of the best straight, or 0 if the mask contains no straight.
+        The wheel (A-2-3-4-5) is reported as 5 high.
+    """
+    # Shift up one bit so the ace can also play low in bit 0
+    extended = (rank_mask << 1) | (rank_mask >> 12)
+    runs = (
+        extended & (extended >> 1) & (extended >> 2) & (extended >> 3) & (extended >> 4)
+    )
+    if not runs:
+        return 0
+    return runs.bit_length() + 4
 
-    for combo in combinations(cards, 5):
-        rank, tiebreakers, name = evaluate_five_card_hand(list(combo))
-        if rank < best_rank or (rank == best_rank and tiebreakers > best_tiebreakers):
-            best_rank = rank
-            best_tiebreakers = tiebreakers
-            best_name = name
 
-    return (best_rank, best_tiebreakers, best_name)
+# High card of the best straight for every 13-bit rank mask (0 if none)
+_STRAIGHT_HIGH: Tuple[int, ...] = tuple(
+    _straight_high(rank_mask) for rank_mask in range(1 << 13)
+)
 
 
-def _check_flush(suits: List[Suit]) -> bool:
+def _top_ranks(rank_mask: int, count: int) -> List[int]:
     """
-    Check if all cards have the same suit.
+    Get the highest ranks present in a rank bitmask.
 
     Args:
-        suits: List of card suits.
+        rank_mask: 13-bit mask with bit ``r - 2`` set for every rank ``r`` present.
+        count: Maximum number of ranks to return.
 
     Returns:
-        True if all cards have the same suit, False otherwise.
+        Up to ``count`` rank values in descending order.
     """
-    return len(set(suits)) == 1
+    ranks = []
+    for rank in range(14, 1, -1):
+        if rank_mask & (1 << (rank - 2)):
+            ranks.append(rank)
+            if len(ranks) == count:
+                break
+    return ranks
 
 
 def _check_straight(ranks: List[int]) -> Tuple[bool, List[int]]:
@@ -206,290 +350,431 @@ def _check_straight(ranks: List[int]) -> Tuple[bool, List[int]]:
         Tuple of (is_straight, adjusted_ranks). Adjusted ranks handle
         the wheel straight (A-2-3-4-5) where ace is treated as low.
     """
-    if len(set(ranks)) != 5:
+    rank_mask = 0
+    for rank in ranks:
+        rank_mask |= 1 << (rank - 2)
+
+    high = _STRAIGHT_HIGH[rank_mask]
+    if not high:
         return (False, ranks)
+    # The wheel comes out as [5, 4, 3, 2, 1], treating the ace as low
+    return (True, list(range(high, high - 5, -1)))
 
-    if ranks[0] - ranks[4] == 4:
-        return (True, ranks)
-    # Check for A-2-3-4-5 straight (wheel)
-    if ranks == [14, 5, 4, 3, 2]:
-        return (True, [5, 4, 3, 2, 1])  # Treat ace as low for tiebreaker
 
-    return (False, ranks)
+# Hand rank for each rank-count shape, for hands that are not straights or flushes
+_SHAPE_TO_RANK: Dict[Tuple[int, ...], int] = {
+    (4, 1): 1,
+    (3, 2): 2,
+    (3, 1, 1): 5,
+    (2, 2, 1): 6,
+    (2, 1, 1, 1): 7,
+    (1, 1, 1, 1, 1): 8,
+}
 
 
-def _check_straight_flush(
-    ranks: List[int], suits: List[Suit]
-) -> Optional[Tuple[int, List[int], str]]:
+def _classify_five_ranks(
+    ranks: List[int], is_flush: bool
+) -> Tuple[int, List[int], str]:
     """
-    Check for straight flush.
+    Classify five card ranks into a poker hand.
+
+    The sorted shape of the rank counts decides the hand class on its own;
+    only five distinct ranks can also make a straight or a flush.
 
     Args:
-        ranks: Sorted list of rank values in descending order.
-        suits: List of card suits.
+        ranks: Sorted list of 5 rank values in descending order.
+        is_flush: Whether all cards share the same suit.
 
     Returns:
-        Tuple of (hand_rank, tiebreaker_values, hand_name) if straight flush,
-        None otherwise.
+        Tuple of (hand_rank, tiebreaker_values, hand_name).
+        Lower hand_rank is better (0 = straight flush, 8 = high card).
     """
-    is_flush = _check_flush(suits)
-    is_straight, adjusted_ranks = _check_straight(ranks)
+    # Count ranks, then group them by count (largest first, high ranks first)
+    counts = [0] * 15
+    for rank in ranks:
+        counts[rank] += 1
+    pattern = sorted(
+        ((count, rank) for rank, count in enumerate(counts) if count), reverse=True
+    )
+    hand_rank = _SHAPE_TO_RANK[tuple(count for count, _ in pattern)]
+
+    if hand_rank == 8:
+        is_straight, tiebreakers = _check_straight(ranks)
+        if is_straight and is_flush:
+            hand_rank = 0
+        elif is_flush:
+            hand_rank, tiebreakers = 3, ranks
+        elif is_straight:
+            hand_rank = 4
+    else:
+        # Grouped ranks are already in tiebreaker order, e.g. [trips, pair]
+        tiebreakers = [rank for _, rank in pattern]
+
+    return (hand_rank, tiebreakers, _hand_name(hand_rank, tiebreakers))
 
-    if is_straight and is_flush:
-        return (
-            0,
-            adjusted_ranks,
-            f"Straight Flush ({get_rank_name(adjusted_ranks[0])} high)",
-        )
 
-    return None
+# (hand_rank, tiebreaker_values, hand_name) of one distinct 5-card hand
+_HandClass = Tuple[int, Tuple[int, ...], str]
 
 
-def _check_four_of_a_kind(
-    rank_counts: Dict[int, int],
-) -> Optional[Tuple[int, List[int], str]]:
+def _build_five_card_tables() -> Tuple[
+    List[int], List[int], Dict[int, int], Tuple[Optional[_HandClass], ...]
+]:
     """
-    Check for four of a kind.
+    Precompute every distinct 5-card hand for the Cactus Kev evaluator.
 
-    Args:
-        rank_counts: Dictionary mapping rank values to their counts.
+    Each of the 7462 distinct hands gets a value from 1 (royal flush) to 7462
+    (7-5-4-3-2 offsuit), so a lower value is always a better hand.
 
     Returns:
-        Tuple of (hand_rank, tiebreaker_values, hand_name) if four of a kind,
-        None otherwise.
-    """
-    counts = sorted(rank_counts.values(), reverse=True)
-    if counts != [4, 1]:
-        return None
+        Tuple of (flush_values, unique_values, paired_values, hand_classes).
+        The first two are indexed by the 13-bit rank mask of five distinct
+        ranks (suited and offsuit respectively), with 0 for any other mask;
+        paired values are keyed by the product of the rank primes.
+        ``hand_classes[value]`` describes the hand with that value, and
+        ``hand_classes[0]`` is None since value 0 means "no such hand".
+    """
+    flush_hands: Dict[int, _HandClass] = {}
+    unique_hands: Dict[int, _HandClass] = {}
+    paired_hands: Dict[int, _HandClass] = {}
+
+    for combo in combinations_with_replacement(range(14, 1, -1), 5):
+        ranks = list(combo)
+        if len(set(ranks)) == 5:
+            rank_mask = sum(1 << (rank - 2) for rank in ranks)
+            rank, tiebreakers, name = _classify_five_ranks(ranks, True)
+            flush_hands[rank_mask] = (rank, tuple(tiebreakers), name)
+            rank, tiebreakers, name = _classify_five_ranks(ranks, False)
+            unique_hands[rank_mask] = (rank, tuple(tiebreakers), name)
+        elif max(ranks.count(rank) for rank in ranks) <= 4:
+            product = prod(_RANK_PRIMES[rank - 2] for rank in ranks)
+            rank, tiebreakers, name = _classify_five_ranks(ranks, False)
+            paired_hands[product] = (rank, tuple(tiebreakers), name)
+
+    # Best hand first: lowest hand rank, then highest tiebreakers
+    hand_classes = sorted(
+        [*flush_hands.values(), *unique_hands.values(), *paired_hands.values()],
+        key=lambda hand: (hand[0], [-value for value in hand[1]]),
+    )
+    values = {hand: value for value, hand in enumerate(hand_classes, 1)}
+
+    flush_values = [0] * (1 << 13)
+    unique_values = [0] * (1 << 13)
+    for rank_mask, hand in flush_hands.items():
+        flush_values[rank_mask] = values[hand]
+    for rank_mask, hand in unique_hands.items():
+        unique_values[rank_mask] = values[hand]
+    paired_values = {product: values[hand] for product, hand in paired_hands.items()}
+
+    # Value 0 marks table misses, so it has no hand class
+    return (flush_values, unique_values, paired_values, (None, *hand_classes))
 
-    four_rank = [r for r, c in rank_counts.items() if c == 4][0]
-    kicker = [r for r, c in rank_counts.items() if c == 1][0]
-    return (1, [four_rank, kicker], f"Four of a Kind ({get_rank_name(four_rank)}s)")
 
+_FLUSH_VALUES, _UNIQUE_VALUES, _PAIRED_VALUES, _HAND_CLASSES = _build_five_card_tables()
 
-def _check_full_house(
-    rank_counts: Dict[int, int],
-) -> Optional[Tuple[int, List[int], str]]:
+
+def _hand_class(value: int) -> _HandClass:
     """
-    Check for full house.
+    Get the description of a hand value.
 
     Args:
-        rank_counts: Dictionary mapping rank values to their counts.
+        value: Hand value from 1 (best) to 7462 (worst).
 
     Returns:
-        Tuple of (hand_rank, tiebreaker_values, hand_name) if full house,
-        None otherwise.
-    """
-    counts = sorted(rank_counts.values(), reverse=True)
-    if counts != [3, 2]:
-        return None
-
-    three_rank = [r for r, c in rank_counts.items() if c == 3][0]
-    pair_rank = [r for r, c in rank_counts.items() if c == 2][0]
-    return (
-        2,
-        [three_rank, pair_rank],
-        f"Full House ({get_rank_name(three_rank)}s over {get_rank_name(pair_rank)}s)",
-    )
+        Tuple of (hand_rank, tiebreaker_values, hand_name).
 
+    Raises:
+        ValueError: If value is the 0 sentinel of a table miss.
+    """
+    hand_class = _HAND_CLASSES[value]
+    if hand_class is None:
+        raise ValueError("Duplicate cards do not form a valid hand")
+    return hand_class
 
-def _check_flush_hand(
-    ranks: List[int], suits: List[Suit]
-) -> Optional[Tuple[int, List[int], str]]:
+
+def _five_card_value(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
     """
-    Check for flush (not straight flush).
+    Look up the Cactus Kev value of five encoded cards.
 
     Args:
-        ranks: Sorted list of rank values in descending order.
-        suits: List of card suits.
+        c1: ``Card.bits`` of the first card (and so on for c2-c5).
 
     Returns:
-        Tuple of (hand_rank, tiebreaker_values, hand_name) if flush,
-        None otherwise.
+        Hand value from 1 (royal flush) to 7462 (worst high card).
+
+    Raises:
+        ValueError: If duplicate cards leave no valid hand, e.g. a suited hand
+            with a repeated rank or five cards of one rank.
     """
-    if _check_flush(suits):
-        return (3, ranks, f"Flush ({get_rank_name(ranks[0])} high)")
-    return None
+    rank_mask = (c1 | c2 | c3 | c4 | c5) >> 16
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        value = _FLUSH_VALUES[rank_mask]
+    else:
+        value = _UNIQUE_VALUES[rank_mask] or _PAIRED_VALUES.get(
+            (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF), 0
+        )
+    if not value:
+        raise ValueError("Duplicate cards do not form a valid hand")
+    return value
 
 
-def _check_straight_hand(ranks: List[int]) -> Optional[Tuple[int, List[int], str]]:
+def evaluate_five_card_hand(cards: Sequence[Card]) -> Tuple[int, List[int], str]:
     """
-    Check for straight (not straight flush).
+    Evaluate a 5-card hand.
+
+    Uses the Cactus Kev encoding in ``Card.bits``: a flush is a single AND of
+    the suit bits, the OR of the rank bits indexes the flush and straight/high
+    card tables, and every other hand is looked up by its product of primes.
+    The resulting hand value is then mapped back to its description.
 
     Args:
-        ranks: Sorted list of rank values in descending order.
+        cards: Sequence (list or tuple) of exactly 5 cards to evaluate.
 
     Returns:
-        Tuple of (hand_rank, tiebreaker_values, hand_name) if straight,
-        None otherwise.
-    """
-    is_straight, adjusted_ranks = _check_straight(ranks)
-    if is_straight:
-        return (
-            4,
-            adjusted_ranks,
-            f"Straight ({get_rank_name(adjusted_ranks[0])} high)",
-        )
-    return None
-
+        Tuple of (hand_rank, tiebreaker_values, hand_name).
+        Lower hand_rank is better (0 = straight flush, 8 = high card).
 
-def _check_three_of_a_kind(
-    rank_counts: Dict[int, int],
-) -> Optional[Tuple[int, List[int], str]]:
+    Raises:
+        ValueError: If duplicate cards leave no valid hand.
     """
-    Check for three of a kind.
+    c1, c2, c3, c4, c5 = [card.bits for card in cards]
+    rank, tiebreakers, name = _hand_class(_five_card_value(c1, c2, c3, c4, c5))
+    return (rank, list(tiebreakers), name)
 
-    Args:
-        rank_counts: Dictionary mapping rank values to their counts.
+
+# Hand value of each (hand_rank, tiebreaker_values) pair
+_HAND_VALUES: Dict[Tuple[int, Tuple[int, ...]], int] = {
+    (hand_class[0], hand_class[1]): value
+    for value, hand_class in enumerate(_HAND_CLASSES)
+    if hand_class is not None
+}
+
+
+def _build_suited_table() -> List[int]:
+    """
+    Precompute the best flush or straight flush for every suited rank mask.
 
     Returns:
-        Tuple of (hand_rank, tiebreaker_values, hand_name) if three of a kind,
-        None otherwise.
-    """
-    counts = sorted(rank_counts.values(), reverse=True)
-    if counts != [3, 1, 1]:
-        return None
-
-    three_rank = [r for r, c in rank_counts.items() if c == 3][0]
-    kickers = sorted([r for r, c in rank_counts.items() if c == 1], reverse=True)
-    return (
-        5,
-        [three_rank] + kickers,
-        f"Three of a Kind ({get_rank_name(three_rank)}s)",
-    )
+        List indexed by the 13-bit rank mask of the cards in one suit, holding
+        the best hand value for masks of 5 or more ranks and 0 otherwise.
+    """
+    suited_values = [0] * (1 << 13)
+    for rank_mask in range(1 << 13):
+        if bin(rank_mask).count("1") < 5:
+            continue
+        high = _STRAIGHT_HIGH[rank_mask]
+        if high:
+            hand = (0, tuple(range(high, high - 5, -1)))
+        else:
+            hand = (3, tuple(_top_ranks(rank_mask, 5)))
+        suited_values[rank_mask] = _HAND_VALUES[hand]
+    return suited_values
+
 
+_SUITED_VALUES = _build_suited_table()
 
-def _check_two_pair(
-    rank_counts: Dict[int, int],
-) -> Optional[Tuple[int, List[int], str]]:
+
+def _best_unsuited_hand(
+    rank_counts: List[int], rank_mask: int
+) -> Tuple[int, List[int]]:
     """
-    Check for two pair.
+    Find the best 5-card hand from rank counts alone, ignoring flushes.
 
     Args:
-        rank_counts: Dictionary mapping rank values to their counts.
+        rank_counts: Number of cards of each rank, indexed by rank value.
+        rank_mask: 13-bit mask with bit ``r - 2`` set for every rank ``r`` present.
 
     Returns:
-        Tuple of (hand_rank, tiebreaker_values, hand_name) if two pair,
-        None otherwise.
-    """
-    counts = sorted(rank_counts.values(), reverse=True)
-    if counts != [2, 2, 1]:
-        return None
-
-    pairs = sorted([r for r, c in rank_counts.items() if c == 2], reverse=True)
-    kicker = [r for r, c in rank_counts.items() if c == 1][0]
-    return (
-        6,
-        pairs + [kicker],
-        f"Two Pair ({get_rank_name(pairs[0])}s and {get_rank_name(pairs[1])}s)",
-    )
+        Tuple of (hand_rank, tiebreaker_values).
+    """
+    # One descending scan buckets the ranks by count, so every bucket is
+    # already in tiebreaker order and nothing needs sorting
+    singles: List[int] = []
+    pairs: List[int] = []
+    trips: List[int] = []
+    quads: List[int] = []
+    # Indexed by count; slot 0 is never used
+    buckets = (singles, singles, pairs, trips, quads)
+    for rank in range(14, 1, -1):
+        count = rank_counts[rank]
+        if count:
+            buckets[count].append(rank)
+
+    if quads:
+        kicker = max(quads[1:2] + trips[:1] + pairs[:1] + singles[:1])
+        return (1, [quads[0], kicker])
+
+    if trips and (pairs or len(trips) > 1):
+        return (2, [trips[0], max(trips[1:2] + pairs[:1])])
+
+    straight_high = _STRAIGHT_HIGH[rank_mask]
+    if straight_high:
+        return (4, list(range(straight_high, straight_high - 5, -1)))
+
+    if trips:
+        return (5, [trips[0]] + singles[:2])
+
+    if len(pairs) > 1:
+        return (6, [pairs[0], pairs[1], max(pairs[2:3] + singles[:1])])
+
+    if pairs:
+        return (7, [pairs[0]] + singles[:3])
+
+    return (8, singles[:5])
 
 
-def _check_one_pair(
-    rank_counts: Dict[int, int],
-) -> Optional[Tuple[int, List[int], str]]:
+@lru_cache(maxsize=None)
+def _unsuited_value(rank_key: int) -> int:
     """
-    Check for one pair.
+    Best hand value of a rank multiset, ignoring flushes.
+
+    Acts as a lazily filled perfect-hash table: there are only 49205 rank
+    multisets of 7 cards, and each is evaluated the first time it is seen.
 
     Args:
-        rank_counts: Dictionary mapping rank values to their counts.
+        rank_key: Rank multiset with a 4-bit count per rank (bits ``4 * (r - 2)``).
 
     Returns:
-        Tuple of (hand_rank, tiebreaker_values, hand_name) if one pair,
-        None otherwise.
+        Hand value from 1 (best) to 7462 (worst).
+
+    Raises:
+        ValueError: If a rank appears more than four times.
     """
-    counts = sorted(rank_counts.values(), reverse=True)
-    if counts != [2, 1, 1, 1]:
-        return None
+    rank_counts = [0, 0] + [(rank_key >> (4 * index)) & 0xF for index in range(13)]
+    if max(rank_counts) > 4:
+        raise ValueError("Duplicate cards do not form a valid hand")
+    rank_mask = sum(1 << index for index in range(13) if rank_counts[index + 2])
+    hand_rank, tiebreakers = _best_unsuited_hand(rank_counts, rank_mask)
+    return _HAND_VALUES[(hand_rank, tuple(tiebreakers))]
+
+
+# Suit counts live in 8-bit fields at bit ``8 * suit_bit`` of a suit key.
+# Adding 123 to every field carries any count of 5 or more into the top bit of
+# its field, so one add and one mask find every flush suit.
+_FLUSH_CARRY = sum(123 << (8 * suit_bit) for suit_bit in _SUIT_BITS)
+_FLUSH_TOP_BITS = sum(128 << (8 * suit_bit) for suit_bit in _SUIT_BITS)
 
-    pair_rank = [r for r, c in rank_counts.items() if c == 2][0]
-    kickers = sorted([r for r, c in rank_counts.items() if c == 1], reverse=True)
-    return (7, [pair_rank] + kickers, f"Pair of {get_rank_name(pair_rank)}s")
+# (rank_key, suit_key) of a set of cards
+_Tally = Tuple[int, int]
 
 
-def evaluate_five_card_hand(cards: List[Card]) -> Tuple[int, List[int], str]:
+def _tally_card_bits(card_bits: Iterable[int], start: _Tally = (0, 0)) -> _Tally:
     """
-    Evaluate a 5-card hand.
+    Count ranks and suits of Cactus Kev encoded cards into two integers.
+
+    Works on plain integers only, so no Card or enum attributes are touched
+    on the hot path, and a tally can be shared and extended without copying.
 
     Args:
-        cards: List of exactly 5 cards to evaluate.
+        card_bits: ``Card.bits`` values of the cards to add.
+        start: Optional tally to continue from (e.g. a shared board).
 
     Returns:
-        Tuple of (hand_rank, tiebreaker_values, hand_name).
-        Lower hand_rank is better (0 = straight flush, 8 = high card).
+        Tuple of (rank_key, suit_key). The rank key holds a 4-bit count per
+        rank at bit ``4 * (r - 2)``; the suit key holds an 8-bit count per
+        suit at bit ``8 * suit_bit``.
     """
-    ranks = sorted([card.rank.value for card in cards], reverse=True)
-    suits = [card.suit for card in cards]
+    rank_key, suit_key = start
+    for bits in card_bits:
+        rank_key += 1 << ((bits >> 6) & 0x3C)
+        suit_key += 1 << ((bits >> 9) & 0x78)
+    return (rank_key, suit_key)
 
-    # Count ranks
-    rank_counts: Dict[int, int] = {}
-    for rank in ranks:
-        rank_counts[rank] = rank_counts.get(rank, 0) + 1
 
-    # Check hand types in order of rank (best to worst)
-    result = _check_straight_flush(ranks, suits)
-    if result:
-        return result
+def _cards_value(card_bits: Sequence[int], tally: _Tally) -> int:
+    """
+    Find the value of the best 5-card hand among some cards.
 
-    result = _check_four_of_a_kind(rank_counts)
-    if result:
-        return result
+    Args:
+        card_bits: ``Card.bits`` values of all the cards, used to collect the
+            ranks of a flush suit.
+        tally: Rank and suit tally of the same cards from ``_tally_card_bits``.
 
-    result = _check_full_house(rank_counts)
-    if result:
-        return result
+    Returns:
+        Hand value from 1 (best) to 7462 (worst).
 
-    result = _check_flush_hand(ranks, suits)
-    if result:
-        return result
+    Raises:
+        ValueError: If duplicate cards leave no valid hand, e.g. a flush suit
+            with fewer than 5 distinct ranks or a rank held more than 4 times.
+    """
+    rank_key, suit_key = tally
+    flush_bits = (suit_key + _FLUSH_CARRY) & _FLUSH_TOP_BITS
+    if not flush_bits:
+        return _unsuited_value(rank_key)
+
+    best_value = len(_HAND_CLASSES)
+    for suit_bit in _SUIT_BITS:
+        if flush_bits & (128 << (8 * suit_bit)):
+            suit_mask = 0
+            for bits in card_bits:
+                if (bits >> 12) & suit_bit:
+                    suit_mask |= bits >> 16
+            value = _SUITED_VALUES[suit_mask]
+            if not value:
+                raise ValueError("Duplicate cards do not form a valid hand")
+            # Four of a kind and full house both need at least 3 cards outside
+            # the flush suit, so with 7 cards a flush is already the best hand
+            count = (suit_key >> (8 * suit_bit)) & 0xFF
+            if len(card_bits) - count < 3:
+                return value
+            best_value = min(best_value, value)
+
+    return min(best_value, _unsuited_value(rank_key))
+
+
+def evaluate_best_hand(cards: Sequence[Card]) -> Tuple[int, List[int], str]:
+    """
+    Evaluate the best 5-card hand from 7 cards.
 
-    result = _check_straight_hand(ranks)
-    if result:
-        return result
+    The cards are evaluated directly rather than by scoring every 5-card
+    combination: the suited rank mask of a flush suit indexes a precomputed
+    flush table, and otherwise the rank multiset is looked up in a lazily
+    filled table of unsuited hand values.
 
-    result = _check_three_of_a_kind(rank_counts)
-    if result:
-        return result
+    Args:
+        cards: Sequence (list or tuple) of 7 cards (2 hole cards + 5 board cards).
 
-    result = _check_two_pair(rank_counts)
-    if result:
-        return result
+    Returns:
+        Tuple of (hand_rank, tiebreaker_values, hand_name).
+        Lower hand_rank is better (0 = straight flush, 8 = high card).
 
-    result = _check_one_pair(rank_counts)
-    if result:
-        return result
+    Raises:
+        ValueError: If fewer than 5 cards are provided, or duplicate cards
+            leave no valid hand.
+    """
+    if len(cards) < 5:
+        raise ValueError("Need at least 5 cards to evaluate a hand")
 
-    # High card
-    return (8, ranks, f"High Card ({get_rank_name(ranks[0])})")
+    card_bits = [card.bits for card in cards]
+    value = _cards_value(card_bits, _tally_card_bits(card_bits))
+    hand_rank, tiebreakers, name = _hand_class(value)
+    return (hand_rank, list(tiebreakers), name)
 
 
-def get_rank_name(rank_value: int) -> str:
+@lru_cache(maxsize=1 << 16)
+def _evaluate_cached(cards_key: int) -> Tuple[int, Tuple[int, ...], str]:
     """
-    Get the name of a rank value.
+    Memoized best-hand evaluation of up to 7 cards.
 
     Args:
-        rank_value: Integer value of the rank (2-14).
+        cards_key: Sum of the ``Card._key`` values of the cards: a 3-bit count
+            per card, so the key is canonical whatever order the cards come in.
 
     Returns:
-        String name of the rank (e.g., "Two", "Ace"). If rank_value is not
-        in the standard range, returns the string representation of the value.
+        Tuple of (hand_rank, tiebreaker_values, hand_name), with the
+        tiebreakers as a tuple so cached results cannot be mutated.
     """
-    rank_map = {
-        2: "Two",
-        3: "Three",
-        4: "Four",
-        5: "Five",
-        6: "Six",
-        7: "Seven",
-        8: "Eight",
-        9: "Nine",
-        10: "Ten",
-        11: "Jack",
-        12: "Queen",
-        13: "King",
-        14: "Ace",
-    }
-    return rank_map.get(rank_value, str(rank_value))
+    card_bits = []
+    for position, bits in enumerate(_DECK_BITS):
+        card_bits += [bits] * ((cards_key >> (3 * position)) & 0x7)
+    return _hand_class(_cards_value(card_bits, _tally_card_bits(card_bits)))
+
+
+# Display string of every card, precomputed once. Red cards are wrapped in the
+# ANSI escape codes for red text.
+_CARD_DISPLAY: Dict[Card, str] = {
+    card: f"\033[91m{card}\033[0m" if card.is_red() else str(card) for card in _DECK
+}
 
 
 def format_card(card: Card) -> str:
@@ -502,24 +787,20 @@ def format_card(card: Card) -> str:
     Returns:
         String representation of the card with ANSI color codes for red cards.
     """
-    card_str = str(card)
-    if card.is_red():
-        # ANSI escape code for red text
-        return f"\033[91m{card_str}\033[0m"
-    return card_str
+    return _CARD_DISPLAY[card]
 
 
-def format_cards(cards: List[Card]) -> str:
+def format_cards(cards: Sequence[Card]) -> str:
     """
     Format a list of cards with proper coloring.
 
     Args:
-        cards: List of cards to format.
+        cards: Sequence of cards to format.
 
     Returns:
         Space-separated string of formatted cards with color codes.
     """
-    return " ".join(format_card(card) for card in cards)
+    return " ".join(map(_CARD_DISPLAY.__getitem__, cards))
 
 
 def generate_quiz(num_answers: Optional[int] = None) -> Tuple[Board, List[Hand], int]:
@@ -534,16 +815,8 @@ def generate_quiz(num_answers: Optional[int] = None) -> Tuple[Board, List[Hand],
         Tuple of (board, hands, correct_answer_index).
         The correct_answer_index indicates which hand in the list is the best.
     """
-    deck = create_deck()
-    random.shuffle(deck)
-
-    # Draw 5 cards for the board
-    board_cards = deck[:5]
-    board = Board(board_cards)
-    remaining_deck = deck[5:]
-
     # Calculate maximum possible hands (47 cards remaining, need 2 per hand)
-    max_possible_hands = len(remaining_deck) // 2
+    max_possible_hands = (len(_DECK) - 5) // 2
 
     # Generate player hands
     if num_answers is not None:
@@ -554,35 +827,54 @@ def generate_quiz(num_answers: Optional[int] = None) -> Tuple[Board, List[Hand],
         # Default behavior: random between 4-9, but not exceeding available cards
         num_hands = random.randint(4, min(9, max_possible_hands))
 
-    hands: List[Hand] = []
+    # Draw only the cards this question uses: 5 for the board, 2 per hand
+    cards = random.sample(_DECK, 5 + 2 * num_hands)
+    board = Board(cards[:5])
+    hands = [Hand(cards[i], cards[i + 1]) for i in range(5, len(cards), 2)]
 
-    for i in range(num_hands):
-        if len(remaining_deck) < 2:
-            break
-        hand = Hand(remaining_deck[0], remaining_deck[1])
-        hands.append(hand)
-        remaining_deck = remaining_deck[2:]
-
-    # Evaluate all hands to find the best one
-    hand_evaluations = []
-    for hand in hands:
-        rank, tiebreakers, name = hand.get_best_hand(board)
-        hand_evaluations.append((rank, tiebreakers, name, hand))
-
-    # Find the best hand (lowest rank, then highest tiebreakers)
-    best_idx = 0
-    best_eval = hand_evaluations[0]
-    for i, eval_result in enumerate(hand_evaluations[1:], 1):
-        rank, tiebreakers, name, hand = eval_result
-        best_rank, best_tiebreakers, best_name, best_hand = best_eval
-
-        if rank < best_rank or (rank == best_rank and tiebreakers > best_tiebreakers):
-            best_idx = i
-            best_eval = eval_result
+    # Score every hand's hole cards against one shared board tally, straight
+    # to its hand value (smaller is better)
+    board_bits = tuple([card.bits for card in cards[:5]])
+    board_tally = _tally_card_bits(board_bits)
+    hand_values = []
+    for i in range(5, len(cards), 2):
+        hole_bits = (cards[i].bits, cards[i + 1].bits)
+        tally = _tally_card_bits(hole_bits, board_tally)
+        hand_values.append(_cards_value(board_bits + hole_bits, tally))
+
+    # Find the best hand (lowest value; the first one on ties)
+    best_idx = min(range(len(hand_values)), key=hand_values.__getitem__)
 
     return (board, hands, best_idx)
 
 
+def generate_quiz_batch(
+    count: int, num_answers: Optional[int] = None
+) -> List[Tuple[Board, List[Hand], int]]:
+    """
+    Generate several independent quiz questions.
+
+    Args:
+        count: Number of questions to generate.
+        num_answers: Optional number of answer choices per question, as for
+            ``generate_quiz``.
+
+    Returns:
+        List of (board, hands, correct_answer_index) tuples.
+
+    Raises:
+        ValueError: If count is negative or num_answers is less than 2.
+    """
+    if count < 0:
+        raise ValueError("count must not be negative")
+    return [generate_quiz(num_answers) for _ in range(count)]
+
+
+# Answer letters, indexed by hand position, and the reverse lookup
+_IDX_TO_LETTER = "ABCDEFGHI"
+_LETTER_TO_IDX = {letter: idx for idx, letter in enumerate(_IDX_TO_LETTER)}
+
+
 def display_quiz(board: Board, hands: List[Hand], correct_idx: int) -> None:
     """
     Display the quiz question.
@@ -599,9 +891,8 @@ def display_quiz(board: Board, hands: List[Hand], correct_idx: int) -> None:
     print(format_cards(board.cards))
     print("\nPlayer Hands:")
 
-    labels = "ABCDEFGHI"
     for i, hand in enumerate(hands):
-        label = labels[i]
+        label = _IDX_TO_LETTER[i]
         marker = " ← BEST HAND" if i == correct_idx else ""
         print(f"  {label}) {format_cards(hand.cards)}{marker}")
 
@@ -646,14 +937,13 @@ def main() -> None:
         if user_input == "QUIT":
             break
 
-        if not user_input or user_input not in "ABCDEFGHI":
+        user_choice = _LETTER_TO_IDX.get(user_input, -1)
+        if user_choice < 0:
             print("Invalid input. Please enter A, B, C, etc.")
             continue
 
-        user_choice = ord(user_input) - ord("A")
-
         if user_choice >= len(hands):
-            max_choice = chr(ord("A") + len(hands) - 1)
+            max_choice = _IDX_TO_LETTER[len(hands) - 1]
             print(f"Invalid choice. Please enter A through {max_choice}.")
             continue
 
@@ -670,11 +960,11 @@ def main() -> None:
             print("✓ Correct!")
             score += 1
         else:
-            print(f"✗ Incorrect. The correct answer was {chr(ord('A') + correct_idx)}.")
+            print(f"✗ Incorrect. The correct answer was {_IDX_TO_LETTER[correct_idx]}.")
             user_rank, user_tiebreakers, user_name = hands[user_choice].get_best_hand(
                 board
             )
-            print(f"  Your choice ({chr(ord('A') + user_choice)}) has: {user_name}")
+            print(f"  Your choice ({_IDX_TO_LETTER[user_choice]}) has: {user_name}")
 
         print(f"\nScore: {score}/{total}")
         print("\nPress Enter to continue or type 'quit' to exit...")
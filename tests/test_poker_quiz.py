@@ -1,5 +1,11 @@
 """Comprehensive unit tests for poker quiz functions."""
 
+import copy
+import pickle
+import random
+from itertools import combinations
+from operator import attrgetter
+
 import pytest
 from poker_quiz import (
     Card,
@@ -10,8 +16,11 @@ from poker_quiz import (
     create_deck,
     evaluate_best_hand,
     evaluate_five_card_hand,
+    format_card,
+    format_cards,
     get_rank_name,
     generate_quiz,
+    generate_quiz_batch,
 )
 
 
@@ -32,6 +41,43 @@ class TestCard:
         assert card1 == card2
         assert card1 != card3
 
+    def test_card_rank_and_suit_are_ints(self):
+        """Test ranks and suits compare as plain integers."""
+        card = Card(Rank.QUEEN, Suit.CLUBS)
+        assert card.rank == 12
+        assert card.suit == 2
+        assert card == Card(Rank(12), Suit(2))
+
+    def test_card_str(self):
+        """Test card string representation."""
+        assert str(Card(Rank.TEN, Suit.HEARTS)) == "10♥"
+        assert str(Card(Rank.ACE, Suit.SPADES)) == "A♠"
+
+    def test_card_bits(self):
+        """Test the Cactus Kev encoding of a card."""
+        assert Card(Rank.KING, Suit.DIAMONDS).bits == 0x08004B25
+        assert Card(Rank.FIVE, Suit.SPADES).bits == 0x00081307
+        assert Card(Rank.ACE, Suit.CLUBS).bits == 0x10008C29
+
+    def test_card_is_interned(self):
+        """Test equal cards are the same object, even after copying."""
+        card = Card(Rank.ACE, Suit.SPADES)
+        assert Card(Rank.ACE, Suit.SPADES) is card
+        assert Card(14, 3) is card
+        assert copy.copy(card) is card
+        assert pickle.loads(pickle.dumps(card)) is card
+
+    def test_card_is_immutable(self):
+        """Test cards cannot be modified."""
+        card = Card(Rank.ACE, Suit.SPADES)
+        with pytest.raises(AttributeError):
+            card.rank = Rank.KING
+
+    def test_card_invalid_rank(self):
+        """Test an invalid rank is rejected."""
+        with pytest.raises(ValueError):
+            Card(1, Suit.SPADES)
+
     def test_card_is_red(self):
         """Test red card detection."""
         red_card = Card(Rank.ACE, Suit.HEARTS)
@@ -52,6 +98,42 @@ class TestHand:
         assert hand.cards[0] == card1
         assert hand.cards[1] == card2
 
+    def test_hand_cards_are_a_tuple(self):
+        """Test hand cards are stored as an immutable tuple without a __dict__."""
+        hand = Hand(Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.SPADES))
+        assert hand.cards == (Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.SPADES))
+        assert not hasattr(hand, "__dict__")
+
+    def test_get_best_hand_repeated_calls(self):
+        """Test cached evaluations are stable and independent of caller edits."""
+        hand = Hand(Card(Rank.ACE, Suit.SPADES), Card(Rank.ACE, Suit.HEARTS))
+        board = Board(
+            [
+                Card(Rank.KING, Suit.DIAMONDS),
+                Card(Rank.KING, Suit.CLUBS),
+                Card(Rank.QUEEN, Suit.SPADES),
+                Card(Rank.NINE, Suit.HEARTS),
+                Card(Rank.SEVEN, Suit.DIAMONDS),
+            ]
+        )
+        first = hand.get_best_hand(board)
+        first[1].clear()
+        assert hand.get_best_hand(board) == (
+            6,
+            [14, 13, 12],
+            "Two Pair (Aces and Kings)",
+        )
+
+    def test_get_best_hand_ignores_card_order(self):
+        """Test reordered boards and hands give the same evaluation."""
+        rng = random.Random(7)
+        for _ in range(50):
+            cards = rng.sample(create_deck(), 7)
+            expected = evaluate_best_hand(cards)
+            rng.shuffle(cards)
+            hand = Hand(cards[0], cards[1])
+            assert hand.get_best_hand(Board(cards[2:])) == expected
+
 
 class TestBoard:
     """Test Board class functionality."""
@@ -68,6 +150,16 @@ class TestBoard:
         with pytest.raises(ValueError, match="Board must have exactly 5 cards"):
             Board(cards)
 
+    def test_board_cards_are_a_tuple(self):
+        """Test board cards are copied into a tuple."""
+        ranks = (Rank.TWO, Rank.FIVE, Rank.EIGHT, Rank.JACK, Rank.ACE)
+        cards = [Card(rank, Suit.HEARTS) for rank in ranks]
+        board = Board(cards)
+        expected = tuple(cards)
+        cards.pop()
+        assert board.cards == expected
+        assert not hasattr(board, "__dict__")
+
 
 class TestDeck:
     """Test deck creation."""
@@ -81,11 +173,17 @@ class TestDeck:
     def test_deck_has_all_ranks_and_suits(self):
         """Test deck contains all rank/suit combinations."""
         deck = create_deck()
-        ranks = set(card.rank for card in deck)
-        suits = set(card.suit for card in deck)
+        ranks = set(map(attrgetter("rank"), deck))
+        suits = set(map(attrgetter("suit"), deck))
         assert len(ranks) == 13
         assert len(suits) == 4
 
+    def test_create_deck_is_shared(self):
+        """Test the deck is built once and shared as an immutable tuple."""
+        deck = create_deck()
+        assert isinstance(deck, tuple)
+        assert create_deck() is deck
+
 
 class TestGetRankName:
     """Test rank name conversion."""
@@ -102,6 +200,20 @@ class TestGetRankName:
         assert get_rank_name(99) == "99"
 
 
+class TestFormatCard:
+    """Test card display formatting."""
+
+    def test_format_card_colors_red_cards(self):
+        """Test red cards are wrapped in ANSI red and black cards are plain."""
+        assert format_card(Card(Rank.ACE, Suit.HEARTS)) == "\033[91mA♥\033[0m"
+        assert format_card(Card(Rank.TEN, Suit.SPADES)) == "10♠"
+
+    def test_format_cards(self):
+        """Test formatting a list of cards."""
+        cards = [Card(Rank.KING, Suit.CLUBS), Card(Rank.TWO, Suit.DIAMONDS)]
+        assert format_cards(cards) == "K♣ \033[91m2♦\033[0m"
+
+
 class TestEvaluateFiveCardHand:
     """Test five-card hand evaluation."""
 
@@ -281,6 +393,28 @@ class TestEvaluateFiveCardHand:
         assert "High Card" in name
         assert tiebreakers[0] == 14  # Ace high
 
+    def test_duplicate_suited_cards_invalid(self):
+        """Test a suited hand with a repeated card is rejected."""
+        cards = [
+            Card(Rank.ACE, Suit.SPADES),
+            Card(Rank.ACE, Suit.SPADES),
+            Card(Rank.KING, Suit.SPADES),
+            Card(Rank.QUEEN, Suit.SPADES),
+            Card(Rank.JACK, Suit.SPADES),
+        ]
+        with pytest.raises(ValueError, match="Duplicate cards"):
+            evaluate_five_card_hand(cards)
+
+    def test_five_of_a_kind_invalid(self):
+        """Test five cards of one rank are rejected."""
+        cards = [Card(Rank.ACE, suit) for suit in Suit] + [Card(Rank.ACE, Suit.SPADES)]
+        with pytest.raises(ValueError, match="Duplicate cards"):
+            evaluate_five_card_hand(cards)
+
+
+# Index tuples of the 21 ways to pick 5 cards out of 7
+COMBOS_7_5 = tuple(combinations(range(7), 5))
+
 
 class TestEvaluateBestHand:
     """Test best hand evaluation from 7 cards."""
@@ -320,12 +454,112 @@ class TestEvaluateBestHand:
         assert tiebreakers[0] == 14  # Aces
         assert tiebreakers[1] == 13  # Kings
 
+    def test_evaluate_best_hand_full_house_from_two_trips(self):
+        """Test full house uses the higher trips and the best remaining pair."""
+        cards = [
+            Card(Rank.NINE, Suit.SPADES),
+            Card(Rank.NINE, Suit.HEARTS),
+            Card(Rank.NINE, Suit.DIAMONDS),
+            Card(Rank.FIVE, Suit.CLUBS),
+            Card(Rank.FIVE, Suit.SPADES),
+            Card(Rank.FIVE, Suit.HEARTS),
+            Card(Rank.KING, Suit.DIAMONDS),
+        ]
+        rank, tiebreakers, name = evaluate_best_hand(cards)
+        assert rank == 2
+        assert tiebreakers == [9, 5]
+        assert name == "Full House (Nines over Fives)"
+
+    def test_evaluate_best_hand_flush_uses_top_five(self):
+        """Test flush keeps the five highest cards of the flush suit."""
+        cards = [
+            Card(Rank.ACE, Suit.HEARTS),
+            Card(Rank.JACK, Suit.HEARTS),
+            Card(Rank.NINE, Suit.HEARTS),
+            Card(Rank.SEVEN, Suit.HEARTS),
+            Card(Rank.FOUR, Suit.HEARTS),
+            Card(Rank.TWO, Suit.HEARTS),
+            Card(Rank.KING, Suit.CLUBS),
+        ]
+        rank, tiebreakers, name = evaluate_best_hand(cards)
+        assert rank == 3
+        assert tiebreakers == [14, 11, 9, 7, 4]
+
+    def test_evaluate_best_hand_prefers_higher_straight_over_wheel(self):
+        """Test the highest straight is chosen when the wheel is also present."""
+        cards = [
+            Card(Rank.ACE, Suit.SPADES),
+            Card(Rank.TWO, Suit.HEARTS),
+            Card(Rank.THREE, Suit.DIAMONDS),
+            Card(Rank.FOUR, Suit.CLUBS),
+            Card(Rank.FIVE, Suit.SPADES),
+            Card(Rank.SIX, Suit.HEARTS),
+            Card(Rank.KING, Suit.DIAMONDS),
+        ]
+        rank, tiebreakers, name = evaluate_best_hand(cards)
+        assert rank == 4
+        assert tiebreakers == [6, 5, 4, 3, 2]
+
+    def test_evaluate_best_hand_matches_best_five_card_combo(self):
+        """Test direct 7-card evaluation agrees with scoring every 5-card combo."""
+        rng = random.Random(1234)
+        deck = create_deck()
+        for _ in range(500):
+            cards = rng.sample(deck, 7)
+            best = None
+            for i0, i1, i2, i3, i4 in COMBOS_7_5:
+                rank, tiebreakers, name = evaluate_five_card_hand(
+                    [cards[i0], cards[i1], cards[i2], cards[i3], cards[i4]]
+                )
+                if best is None or (-rank, tiebreakers) > (-best[0], best[1]):
+                    best = (rank, tiebreakers, name)
+            assert evaluate_best_hand(cards) == best
+
+    def test_evaluate_best_hand_accepts_tuple(self):
+        """Test evaluators accept any sequence of cards, not only lists."""
+        cards = (
+            Card(Rank.ACE, Suit.SPADES),
+            Card(Rank.ACE, Suit.HEARTS),
+            Card(Rank.KING, Suit.DIAMONDS),
+            Card(Rank.QUEEN, Suit.CLUBS),
+            Card(Rank.JACK, Suit.SPADES),
+        )
+        assert evaluate_best_hand(cards) == evaluate_five_card_hand(cards)
+        assert evaluate_five_card_hand(cards)[0] == 7
+
     def test_evaluate_best_hand_insufficient_cards(self):
         """Test error when insufficient cards provided."""
         cards = [Card(Rank.ACE, Suit.SPADES) for _ in range(4)]
         with pytest.raises(ValueError, match="Need at least 5 cards"):
             evaluate_best_hand(cards)
 
+    def test_evaluate_best_hand_duplicate_flush_cards_invalid(self):
+        """Test a flush suit padded out by a repeated card is rejected."""
+        cards = [
+            Card(Rank.ACE, Suit.SPADES),
+            Card(Rank.ACE, Suit.SPADES),
+            Card(Rank.KING, Suit.SPADES),
+            Card(Rank.QUEEN, Suit.SPADES),
+            Card(Rank.JACK, Suit.SPADES),
+            Card(Rank.TWO, Suit.HEARTS),
+            Card(Rank.THREE, Suit.DIAMONDS),
+        ]
+        with pytest.raises(ValueError, match="Duplicate cards"):
+            evaluate_best_hand(cards)
+        hand = Hand(cards[0], cards[1])
+        with pytest.raises(ValueError, match="Duplicate cards"):
+            hand.get_best_hand(Board(cards[2:]))
+
+    def test_evaluate_best_hand_five_of_a_kind_invalid(self):
+        """Test five cards of one rank are rejected."""
+        cards = [Card(Rank.ACE, suit) for suit in Suit] + [
+            Card(Rank.ACE, Suit.SPADES),
+            Card(Rank.TWO, Suit.HEARTS),
+            Card(Rank.THREE, Suit.DIAMONDS),
+        ]
+        with pytest.raises(ValueError, match="Duplicate cards"):
+            evaluate_best_hand(cards)
+
 
 class TestGenerateQuiz:
     """Test quiz generation."""
@@ -362,6 +596,27 @@ class TestGenerateQuiz:
                     or (best_rank == rank and best_tiebreakers >= tiebreakers)
                 )
 
+    def test_generate_quiz_cards_are_distinct(self):
+        """Test that no card is dealt twice in a question."""
+        board, hands, _ = generate_quiz(num_answers=9)
+        dealt = list(board.cards) + [card for hand in hands for card in hand.cards]
+        assert len(hands) == 9
+        assert len(set(dealt)) == len(dealt) == 23
+
+    def test_generate_quiz_batch(self):
+        """Test generating several questions at once."""
+        questions = generate_quiz_batch(5, num_answers=3)
+        assert len(questions) == 5
+        for board, hands, correct_idx in questions:
+            assert len(board.cards) == 5
+            assert len(hands) == 3
+            assert 0 <= correct_idx < 3
+
+    def test_generate_quiz_batch_invalid_count(self):
+        """Test batch generation rejects a negative count."""
+        with pytest.raises(ValueError, match="count must not be negative"):
+            generate_quiz_batch(-1)
+
 
 class TestHandComparison:
     """Test hand comparison logic."""